@@ -1,11 +1,22 @@
 import sys
 import socket
+import select
+import struct
+import selectors
 import threading
 import os
 import time
+import queue
+import ctypes
+import ipaddress
 import configparser
+from concurrent.futures import ThreadPoolExecutor
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QListWidget, QListWidgetItem, QPushButton, QFileDialog, QLabel, QProgressBar, QHBoxLayout, QInputDialog, QSystemTrayIcon, QMenu
-from PyQt6.QtCore import QThread, pyqtSignal, Qt, QEvent
+from PyQt6.QtCore import QThread, pyqtSignal, Qt, QEvent, QTimer, QObject, QRunnable, QThreadPool
 from PyQt6.QtGui import QIcon, QShortcut, QKeySequence, QAction
 if sys.platform == "win32":
     try:
@@ -14,27 +25,125 @@ if sys.platform == "win32":
         winsound = None
 
 # --- Constants ---
-# OPTIMISATION: Buffers plus grands pour réduire les appels système. 2MB.
-BUFFER_SIZE = 2 * 1024 * 1024
-# Plage d'auto‑tuning (512KB ↔ 2MB)
-MIN_BUFFER_SIZE = 512 * 1024
-MAX_BUFFER_SIZE = 2 * 1024 * 1024
-# Fenêtre et seuils d'adaptation
-ADAPT_WINDOW_SECONDS = 0.75
-ADAPT_IMPROVE_THRESHOLD = 0.10  # +10% -> tenter d'augmenter la taille de chunk
-ADAPT_WORSEN_THRESHOLD = 0.10   # -10% -> diminuer la taille de chunk
-# OPTIMISATION: Seuil de mise à jour de la barre de progression (tous les 512KB)
-UPDATE_BYTES_THRESHOLD = 512 * 1024
-# NOUVEAU: Taille des buffers de socket (envoi/réception) alloués par l'OS. 2MB.
+# OPTIMISATION: taille de chunk fixe à 1MB (pic de wmem TCP par défaut sous Linux);
+# le contrôle de flux TCP rend l'ancienne adaptation dynamique inutile en régime établi
+BUFFER_SIZE = 1024 * 1024
+# Taille des buffers de socket (envoi/réception) si le réglage manuel est activé. 2MB.
+# ATTENTION: fixer SO_SNDBUF/SO_RCVBUF désactive l'auto-tuning de la fenêtre TCP du
+# noyau et peut plafonner le débit sur les liens à fort produit bande passante × délai.
+# Désactivé par défaut; le noyau dimensionne mieux tout seul.
+ENABLE_MANUAL_SOCKBUF = False
 SOCKET_BUFFER_SIZE = 2 * 1024 * 1024
 SOCKET_TIMEOUT = 10  # Un peu plus de temps pour les grosses connexions
-FILE_SIZE_HEADER_LENGTH = 20
+# Protocole binaire (big-endian): version (1 octet), taille totale du fichier (8),
+# offset du flux (8), longueur du flux (8), nombre de flux (1), longueur du nom (2).
+# Remplace l'ancien en-tête ASCII de 20 caractères.
+PROTOCOL_VERSION = 3
+HEADER_FORMAT = ">BQQQBH"
+HEADER_LENGTH = struct.calcsize(HEADER_FORMAT)
+# Taille de passe sendfile: le noyau découpe lui-même en segments TCP, une seule
+# remontée en Python par passe suffit
+SENDFILE_CHUNK = 16 * 1024 * 1024
+# Transfert multi-flux: au-delà de ce seuil le fichier est découpé en plages
+# contiguës envoyées sur plusieurs connexions TCP parallèles (une seule fenêtre
+# de congestion ne sature pas toujours le lien)
+PARALLEL_MIN_FILE_SIZE = 64 * 1024 * 1024
+PARALLEL_STREAMS = 4
 TRANSFER_PORT = 8513
 DISCOVERY_PORT = 8512
 BROADCAST_INTERVAL = 5
 APP_VERSION = "V1.3"
 STARTUP_REG_NAME = "ZactShare"
 
+# OPTIMISATION: pool LIFO de buffers réutilisés par les chemins d'envoi/réception
+# non zéro-copie; un buffer de 1MB est alloué par slot de worker, pas par transfert
+_BUFFER_POOL = queue.LifoQueue()
+
+def _buffer_get(size=BUFFER_SIZE):
+    try:
+        buf = _BUFFER_POOL.get_nowait()
+    except queue.Empty:
+        return bytearray(size)
+    if len(buf) != size:
+        buf = bytearray(size)
+    return buf
+
+def _buffer_put(buf):
+    _BUFFER_POOL.put(buf)
+
+def _wait_ready(sock, for_write=False):
+    # settimeout() rend le socket non bloquant: les chemins sendfile/splice
+    # attendent ici quand le noyau renvoie EAGAIN, avec le même délai limite
+    # que les opérations socket classiques
+    if for_write:
+        _, ready, _ = select.select([], [sock], [], SOCKET_TIMEOUT)
+    else:
+        ready, _, _ = select.select([sock], [], [], SOCKET_TIMEOUT)
+    if not ready:
+        raise socket.timeout("timed out")
+
+# OPTIMISATION: sendmmsg(2) via ctypes — les annonces unicast vers N pairs
+# partent en un seul syscall au lieu de N sendto (pas de binding Python natif)
+class _sockaddr_in(ctypes.Structure):
+    _fields_ = [("sin_family", ctypes.c_ushort),
+                ("sin_port", ctypes.c_uint16),
+                ("sin_addr", ctypes.c_ubyte * 4),
+                ("sin_zero", ctypes.c_char * 8)]
+
+class _iovec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p),
+                ("iov_len", ctypes.c_size_t)]
+
+class _msghdr(ctypes.Structure):
+    _fields_ = [("msg_name", ctypes.c_void_p),
+                ("msg_namelen", ctypes.c_uint32),
+                ("msg_iov", ctypes.POINTER(_iovec)),
+                ("msg_iovlen", ctypes.c_size_t),
+                ("msg_control", ctypes.c_void_p),
+                ("msg_controllen", ctypes.c_size_t),
+                ("msg_flags", ctypes.c_int)]
+
+class _mmsghdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _msghdr),
+                ("msg_len", ctypes.c_uint)]
+
+_LIBC_SENDMMSG = None
+if sys.platform.startswith("linux"):
+    try:
+        _LIBC_SENDMMSG = ctypes.CDLL(None, use_errno=True).sendmmsg
+    except (OSError, AttributeError):
+        _LIBC_SENDMMSG = None
+
+def _sendmmsg(sock, payload, addrs):
+    """Sends the same datagram to each (ip, port); batched on Linux, looped elsewhere."""
+    if _LIBC_SENDMMSG is not None and len(addrs) > 1:
+        try:
+            n = len(addrs)
+            buf = ctypes.create_string_buffer(payload, len(payload))
+            names = (_sockaddr_in * n)()
+            iovs = (_iovec * n)()
+            msgs = (_mmsghdr * n)()
+            for i, (ip, port) in enumerate(addrs):
+                names[i].sin_family = socket.AF_INET
+                names[i].sin_port = socket.htons(port)
+                names[i].sin_addr = (ctypes.c_ubyte * 4)(*socket.inet_aton(ip))
+                iovs[i].iov_base = ctypes.cast(buf, ctypes.c_void_p)
+                iovs[i].iov_len = len(payload)
+                msgs[i].msg_hdr.msg_name = ctypes.cast(ctypes.byref(names[i]), ctypes.c_void_p)
+                msgs[i].msg_hdr.msg_namelen = ctypes.sizeof(_sockaddr_in)
+                msgs[i].msg_hdr.msg_iov = ctypes.cast(ctypes.byref(iovs[i]), ctypes.POINTER(_iovec))
+                msgs[i].msg_hdr.msg_iovlen = 1
+            if _LIBC_SENDMMSG(sock.fileno(), msgs, n, 0) == n:
+                return
+        except (OSError, ValueError):
+            pass
+    # Repli portable: un sendto par destinataire
+    for addr in addrs:
+        try:
+            sock.sendto(payload, addr)
+        except OSError:
+            pass
+
 DARK_STYLE = """
 QWidget {
     background-color: #111827;
@@ -80,206 +189,285 @@ class DiscoveryThread(QThread):
     def __init__(self):
         super().__init__()
         self._sock = None
+        # Paire de sockets pour réveiller select() immédiatement à l'arrêt, sans
+        # polling. Des sockets plutôt qu'un os.pipe(): le DefaultSelector de
+        # Windows repose sur select(), qui n'accepte que des sockets.
+        # Les deux vivent aussi longtemps que le thread, jamais réutilisés.
+        self._wake_r, self._wake_w = socket.socketpair()
 
     def stop(self):
         self.requestInterruption()
         try:
-            if self._sock is not None:
-                self._sock.close()
-        except Exception:
+            self._wake_w.send(b"x")
+        except OSError:
             pass
 
     def run(self):
+        # OPTIMISATION: le filtrage des auto-annonces se fait ici, dans le thread
+        # de découverte — le thread GUI ne touche plus au réseau par annonce
+        local_ip = ""
+        try:
+            probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            probe.connect(("8.8.8.8", 80))
+            local_ip = probe.getsockname()[0]
+            probe.close()
+        except Exception:
+            pass
         self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sel = selectors.DefaultSelector()
         try:
             self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self._sock.bind(("", DISCOVERY_PORT))
-            # Use a very short timeout so the thread reacts to interruption quickly
-            self._sock.settimeout(0.2)
+            # OPTIMISATION: blocage sur select (epoll sous Linux) au lieu d'un
+            # timeout court; zéro réveil périodique et arrêt instantané via le pipe
+            self._sock.setblocking(False)
+            sel.register(self._sock, selectors.EVENT_READ)
+            sel.register(self._wake_r, selectors.EVENT_READ)
             while not self.isInterruptionRequested():
                 try:
-                    data, addr = self._sock.recvfrom(1024)
+                    events = sel.select()
+                except OSError:
+                    break
+                for key, _ in events:
+                    if key.fileobj is self._wake_r:
+                        self._wake_r.recv(16)
+                        return
+                    try:
+                        data, addr = self._sock.recvfrom(1024)
+                    except (BlockingIOError, InterruptedError):
+                        continue
+                    except OSError:
+                        # Likely closed during shutdown
+                        return
+                    # OPTIMISATION: filtrage sur le préfixe en bytes — le trafic UDP
+                    # étranger est écarté sans allocation de str ni validation UTF-8
+                    if not data.startswith(b"discovery_announce"):
+                        continue
                     # Compat: accepter l'ancien format b"discovery_announce" et le nouveau "discovery_announce:<hostname>"
                     if data == b"discovery_announce":
-                        self.device_found.emit(addr[0], "")
+                        if not local_ip or addr[0] != local_ip:
+                            self.device_found.emit(addr[0], "")
                         continue
-                    hostname = ""
-                    try:
-                        text = data.decode("utf-8", errors="ignore")
-                    except Exception:
-                        text = ""
-                    if text.startswith("discovery_announce"):
-                        # Formats supportés:
-                        # - discovery_announce:<name>
-                        # - discovery_announce:<name>|<ip>
-                        name = ""
-                        ip_from_msg = ""
-                        parts = text.split(":", 1)
-                        if len(parts) == 2:
-                            rest = parts[1]
-                            subparts = rest.split("|", 1)
+                    # Formats supportés:
+                    # - discovery_announce:<name>
+                    # - discovery_announce:<name>|<ip>
+                    name = ""
+                    ip_from_msg = ""
+                    parts = data.split(b":", 1)
+                    if len(parts) == 2:
+                        subparts = parts[1].split(b"|", 1)
+                        try:
                             if len(subparts) == 2:
-                                name = subparts[0].strip()
-                                ip_from_msg = subparts[1].strip()
+                                name = subparts[0].decode("utf-8", errors="ignore").strip()
+                                ip_from_msg = subparts[1].decode("utf-8", errors="ignore").strip()
                             else:
-                                name = rest.strip()
-                        use_ip = ip_from_msg or addr[0]
-                        self.device_found.emit(use_ip, name)
-                except socket.timeout:
-                    continue
-                except OSError:
-                    # Likely closed during shutdown
-                    break
-                except Exception as e:
-                    print(f"Error in discovery thread: {e}")
-                    break
+                                name = parts[1].decode("utf-8", errors="ignore").strip()
+                        except Exception:
+                            pass
+                    use_ip = ip_from_msg or addr[0]
+                    if local_ip and use_ip == local_ip:
+                        continue
+                    self.device_found.emit(use_ip, name)
+        except Exception as e:
+            print(f"Error in discovery thread: {e}")
         finally:
+            sel.close()
             try:
                 if self._sock is not None:
                     self._sock.close()
             finally:
                 self._sock = None
 
-class FileSenderThread(QThread):
-    """Thread to send a file to a remote device."""
-    progress = pyqtSignal(float, float, float)
+class FileSenderSignals(QObject):
+    """Signal holder for FileSenderWorker (QRunnable cannot carry signals itself)."""
     finished = pyqtSignal()
 
+class FileSenderWorker(QRunnable):
+    """Pooled worker that sends a file to a remote device, possibly over several streams."""
+
     def __init__(self, file_path, host):
         super().__init__()
+        self.signals = FileSenderSignals()
         self.file_path = file_path
+        self.file_basename = os.path.basename(file_path)
         self.host = host
-        self._sock = None
+        self._socks = []
+        self._stop_event = threading.Event()
+        # Compteurs lus par le QTimer de la fenêtre principale (chaque flux
+        # écrit sa propre case, mise à jour atomique sous le GIL)
+        self._stream_done = [0]
+        self.bytes_total = 0
+        self.start_ns = 0
+        # La fenêtre garde la référence pour échantillonner la progression
+        self.setAutoDelete(False)
+
+    @property
+    def bytes_done(self):
+        return sum(self._stream_done)
+
+    def isInterruptionRequested(self):
+        return self._stop_event.is_set()
 
     def stop(self):
-        self.requestInterruption()
-        try:
-            if self._sock is not None:
-                self._sock.close()
-        except Exception:
-            pass
+        self._stop_event.set()
+        for sock in list(self._socks):
+            try:
+                sock.close()
+            except Exception:
+                pass
 
     def run(self):
         try:
-            file_size = os.path.getsize(self.file_path)
-            self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            try:
-                # OPTIMISATION: Réglages du socket pour la performance
-                self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
-                self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # OPTIMISATION: une seule ouverture + fstat au lieu du couple
+            # getsize/open qui re-parcourt le chemin (et évite un TOCTOU)
+            with open(self.file_path, "rb") as f:
+                file_size = os.fstat(f.fileno()).st_size
+                # OPTIMISATION: au-delà du seuil, K connexions TCP parallèles envoient
+                # chacune une plage contiguë du fichier (fenêtres de congestion indépendantes)
+                n_streams = PARALLEL_STREAMS if file_size >= PARALLEL_MIN_FILE_SIZE else 1
+                self.bytes_total = file_size
+                self._stream_done = [0] * n_streams
+                self.start_ns = time.monotonic_ns()
+                # Découpage du fichier en plages contiguës
+                base_length = file_size // n_streams
+                ranges = []
+                offset = 0
+                for i in range(n_streams):
+                    length = base_length if i < n_streams - 1 else file_size - offset
+                    ranges.append((offset, length))
+                    offset += length
+                helpers = []
+                for i in range(1, n_streams):
+                    t = threading.Thread(
+                        target=self._open_and_send,
+                        args=(i, n_streams, file_size, ranges[i][0], ranges[i][1])
+                    )
+                    t.daemon = True
+                    t.start()
+                    helpers.append(t)
+                # Le flux 0 est envoyé par ce thread, avec le fichier déjà ouvert
+                self._send_stream(0, n_streams, file_size, ranges[0][0], ranges[0][1], f)
+                for t in helpers:
+                    t.join()
+        except Exception as e:
+            print(f"Error sending file: {e}")
+        finally:
+            self.signals.finished.emit()
 
-                self._sock.settimeout(SOCKET_TIMEOUT)
-                self._sock.connect((self.host, TRANSFER_PORT))
-                
-                filename = os.path.basename(self.file_path)
-                self._sock.sendall(f"{file_size:<{FILE_SIZE_HEADER_LENGTH}}".encode('utf-8'))
-                self._sock.sendall(filename.encode('utf-8') + b'\n')
-                
-                sent_bytes = 0
-                start_time = time.time()
-                last_update_bytes = 0
-                # Variables pour l'auto-tuning
-                current_chunk_size = BUFFER_SIZE
-                last_adapt_time = start_time
-                last_adapt_bytes = 0
-                
-                # Tente d'utiliser sendfile (zéro-copie) si disponible pour de meilleures perfs
-                with open(self.file_path, "rb") as f:
+    def _open_and_send(self, index, n_streams, file_size, stream_offset, stream_length):
+        """Helper-stream entry point: opens its own file handle (independent offset)."""
+        try:
+            with open(self.file_path, "rb") as f:
+                self._send_stream(index, n_streams, file_size, stream_offset, stream_length, f)
+        except Exception as e:
+            print(f"Error sending file: {e}")
+
+    def _send_stream(self, index, n_streams, file_size, stream_offset, stream_length, f):
+        """Sends one byte range of the file over its own TCP connection."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socks.append(sock)
+        try:
+            # OPTIMISATION: Réglages du socket pour la performance
+            if ENABLE_MANUAL_SOCKBUF:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            sock.settimeout(SOCKET_TIMEOUT)
+            sock.connect((self.host, TRANSFER_PORT))
+
+            # En-tête + nom envoyés en un seul sendall (un seul segment TCP)
+            name_bytes = self.file_basename.encode('utf-8')
+            header = struct.pack(HEADER_FORMAT, PROTOCOL_VERSION, file_size,
+                                 stream_offset, stream_length, n_streams, len(name_bytes))
+            # OPTIMISATION: TCP_CORK (Linux) agrège l'en-tête et le début du
+            # fichier dans un même segment plein, malgré TCP_NODELAY; le
+            # décorquage en fin de transfert pousse le reliquat
+            corked = False
+            if hasattr(socket, "TCP_CORK"):
+                try:
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 1)
+                    corked = True
+                except OSError:
+                    pass
+            sock.sendall(header + name_bytes)
+
+            sent_bytes = 0
+
+            # Tente d'utiliser sendfile (zéro-copie) si disponible pour de meilleures perfs
+            try:
+                # OPTIMISATION: os.sendfile direct avec un gros count — une seule
+                # remontée en Python par ~16MB transférés; pas d'adaptation de
+                # chunk ici, la pile TCP maximise déjà la taille des envois
+                sock_fd = sock.fileno()
+                file_fd = f.fileno()
+                while not self.isInterruptionRequested() and sent_bytes < stream_length:
+                    to_send = min(SENDFILE_CHUNK, stream_length - sent_bytes)
                     try:
-                        offset = 0
-                        while not self.isInterruptionRequested() and offset < file_size:
-                            to_send = min(current_chunk_size, file_size - offset)
-                            sent = self._sock.sendfile(f, offset, to_send)
-                            if sent is None:
-                                # Certaines implémentations renvoient None => considérer que tout a été envoyé
-                                offset = file_size
-                                sent_bytes = file_size
-                                break
-                            if sent == 0:
-                                break
-                            offset += sent
-                            sent_bytes += sent
-                            # Adaptation périodique de la taille de chunk
-                            now = time.time()
-                            if now - last_adapt_time >= ADAPT_WINDOW_SECONDS:
-                                window_bytes = sent_bytes - last_adapt_bytes
-                                window_speed = window_bytes / (now - last_adapt_time)
-                                # Comparer avec la vitesse moyenne précédente
-                                total_elapsed = now - start_time
-                                avg_speed = sent_bytes / total_elapsed if total_elapsed > 0 else 0
-                                if avg_speed > 0:
-                                    delta = (window_speed - avg_speed) / avg_speed
-                                    if delta > ADAPT_IMPROVE_THRESHOLD and current_chunk_size < MAX_BUFFER_SIZE:
-                                        current_chunk_size = min(current_chunk_size * 2, MAX_BUFFER_SIZE)
-                                    elif delta < -ADAPT_WORSEN_THRESHOLD and current_chunk_size > MIN_BUFFER_SIZE:
-                                        current_chunk_size = max(current_chunk_size // 2, MIN_BUFFER_SIZE)
-                                last_adapt_time = now
-                                last_adapt_bytes = sent_bytes
-                            if sent_bytes - last_update_bytes > UPDATE_BYTES_THRESHOLD or sent_bytes == file_size:
-                                elapsed_time = time.time() - start_time
-                                speed = sent_bytes / elapsed_time if elapsed_time > 0 else 0
-                                self.progress.emit(float(sent_bytes), float(file_size), speed)
-                                last_update_bytes = sent_bytes
-                    except Exception:
-                        # Fallback à l'envoi classique en cas d'indisponibilité de sendfile
-                        f.seek(0)
-                        buffer = bytearray(BUFFER_SIZE)
-                        view = memoryview(buffer)
-                        while not self.isInterruptionRequested():
-                            # Lire au plus current_chunk_size
-                            if len(buffer) != current_chunk_size:
-                                buffer = bytearray(current_chunk_size)
-                                view = memoryview(buffer)
-                            bytes_read = f.readinto(buffer)
-                            if not bytes_read:
-                                break
-                            self._sock.sendall(view[:bytes_read])
-                            sent_bytes += bytes_read
-                            # Adaptation périodique de la taille de chunk
-                            now = time.time()
-                            if now - last_adapt_time >= ADAPT_WINDOW_SECONDS:
-                                window_bytes = sent_bytes - last_adapt_bytes
-                                window_speed = window_bytes / (now - last_adapt_time)
-                                total_elapsed = now - start_time
-                                avg_speed = sent_bytes / total_elapsed if total_elapsed > 0 else 0
-                                if avg_speed > 0:
-                                    delta = (window_speed - avg_speed) / avg_speed
-                                    if delta > ADAPT_IMPROVE_THRESHOLD and current_chunk_size < MAX_BUFFER_SIZE:
-                                        current_chunk_size = min(current_chunk_size * 2, MAX_BUFFER_SIZE)
-                                    elif delta < -ADAPT_WORSEN_THRESHOLD and current_chunk_size > MIN_BUFFER_SIZE:
-                                        current_chunk_size = max(current_chunk_size // 2, MIN_BUFFER_SIZE)
-                                last_adapt_time = now
-                                last_adapt_bytes = sent_bytes
-                            if sent_bytes - last_update_bytes > UPDATE_BYTES_THRESHOLD or sent_bytes == file_size:
-                                elapsed_time = time.time() - start_time
-                                speed = sent_bytes / elapsed_time if elapsed_time > 0 else 0
-                                self.progress.emit(float(sent_bytes), float(file_size), speed)
-                                last_update_bytes = sent_bytes
-                        
-                        if sent_bytes - last_update_bytes > UPDATE_BYTES_THRESHOLD or sent_bytes == file_size:
-                            elapsed_time = time.time() - start_time
-                            speed = sent_bytes / elapsed_time if elapsed_time > 0 else 0
-                            self.progress.emit(float(sent_bytes), float(file_size), speed)
-                            last_update_bytes = sent_bytes
-            finally:
+                        sent = os.sendfile(sock_fd, file_fd, stream_offset + sent_bytes, to_send)
+                    except BlockingIOError:
+                        _wait_ready(sock, for_write=True)
+                        continue
+                    if sent == 0:
+                        break
+                    sent_bytes += sent
+                    self._stream_done[index] = sent_bytes
+            except socket.timeout:
+                raise
+            except Exception:
+                # Fallback à l'envoi classique en cas d'indisponibilité de sendfile
+                f.seek(stream_offset + sent_bytes)
+                buffer = _buffer_get(BUFFER_SIZE)
+                view = memoryview(buffer)
+                while not self.isInterruptionRequested() and sent_bytes < stream_length:
+                    # Lire au plus BUFFER_SIZE, borné par la plage du flux
+                    to_read = min(BUFFER_SIZE, stream_length - sent_bytes)
+                    bytes_read = f.readinto(view[:to_read])
+                    if not bytes_read:
+                        break
+                    sock.sendall(view[:bytes_read])
+                    sent_bytes += bytes_read
+                    self._stream_done[index] = sent_bytes
+                _buffer_put(buffer)
+            if corked:
                 try:
-                    if self._sock is not None:
-                        self._sock.close()
-                finally:
-                    self._sock = None
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 0)
+                except OSError:
+                    pass
+            # Compteur final (couvre aussi le cas sendfile => None)
+            self._stream_done[index] = sent_bytes
         except Exception as e:
             print(f"Error sending file: {e}")
         finally:
-            self.finished.emit()
+            try:
+                sock.close()
+            finally:
+                try:
+                    self._socks.remove(sock)
+                except ValueError:
+                    pass
 
 class FileReceiverThread(QThread):
     """Thread to listen for incoming connections and receive files."""
     reception_started = pyqtSignal(str)
     file_received = pyqtSignal(str)
-    progress = pyqtSignal(float, float, float)
 
     def __init__(self):
         super().__init__()
+        # Compteurs lus par le QTimer de la fenêtre principale
+        self.bytes_done = 0
+        self.bytes_total = 0
+        self.start_ns = 0
+        # Transferts multi-flux en cours, indexés par (ip émetteur, nom, taille):
+        # les K connexions d'un même envoi écrivent dans le même fichier
+        self._transfers = {}
+        self._transfers_lock = threading.Lock()
+        # OPTIMISATION: pool borné de workers — les threads sont réutilisés d'une
+        # connexion à l'autre et un afflux de clients ne peut pas en créer sans limite
+        self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="recv")
+        # Connexions acceptées en cours de traitement: fermées par stop() pour
+        # débloquer immédiatement les workers (non-daemon) du pool à la sortie
+        self._conns = set()
+        self._conns_lock = threading.Lock()
         self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.server_socket.bind(("", TRANSFER_PORT))
@@ -291,6 +479,13 @@ class FileReceiverThread(QThread):
             self.server_socket.close()
         except Exception:
             pass
+        with self._conns_lock:
+            for conn in list(self._conns):
+                try:
+                    conn.close()
+                except OSError:
+                    pass
+        self._pool.shutdown(wait=False, cancel_futures=True)
 
     def run(self):
         downloads_path = os.path.join(os.path.expanduser("~"), "Downloads")
@@ -302,16 +497,14 @@ class FileReceiverThread(QThread):
                 conn, addr = self.server_socket.accept()
                 
                 # OPTIMISATION: Réglages du socket de connexion pour la performance
-                conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+                if ENABLE_MANUAL_SOCKBUF:
+                    conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
                 conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
                 
-                # Créer un thread dédié pour gérer ce client spécifique
-                client_handler = threading.Thread(
-                    target=self.handle_client,
-                    args=(conn, addr, downloads_path)
-                )
-                client_handler.daemon = True
-                client_handler.start()
+                # Confier ce client à un worker du pool
+                with self._conns_lock:
+                    self._conns.add(conn)
+                self._pool.submit(self.handle_client, conn, addr, downloads_path)
 
             except Exception as e:
                 if not self.isInterruptionRequested():
@@ -324,85 +517,286 @@ class FileReceiverThread(QThread):
         try:
             with conn:
                 conn.settimeout(SOCKET_TIMEOUT)
-                
-                file_size_bytes = b''
-                while len(file_size_bytes) < FILE_SIZE_HEADER_LENGTH:
-                    chunk = conn.recv(FILE_SIZE_HEADER_LENGTH - len(file_size_bytes))
-                    if not chunk: raise ConnectionError("Connection closed early.")
-                    file_size_bytes += chunk
-                file_size = int(file_size_bytes.strip().decode('utf-8'))
-                
-                filename_bytes = b''
-                while (byte := conn.recv(1)) not in [b'\n', b'']:
-                    filename_bytes += byte
-                filename = os.path.basename(filename_bytes.decode('utf-8'))
-                
-                self.reception_started.emit(f"{filename} from {addr[0]}")
-
-                save_path = self.get_unique_save_path(downloads_path, filename)
-
-                received_bytes = 0
-                start_time = time.time()
-                last_update_bytes = 0
-
-                with open(save_path, "wb") as f:
-                    current_chunk_size = BUFFER_SIZE
-                    buffer = bytearray(current_chunk_size)
-                    view = memoryview(buffer)
-                    last_adapt_time = time.time()
-                    last_adapt_bytes = 0
-                    while received_bytes < file_size:
-                        to_recv = min(current_chunk_size, file_size - received_bytes)
-                        if len(buffer) != current_chunk_size:
-                            buffer = bytearray(current_chunk_size)
-                            view = memoryview(buffer)
-                        n = conn.recv_into(view[:to_recv])
-                        if not n:
-                            break
-                        f.write(view[:n])
-                        received_bytes += n
-                        # Adaptation périodique
-                        now = time.time()
-                        if now - last_adapt_time >= ADAPT_WINDOW_SECONDS:
-                            window_bytes = received_bytes - last_adapt_bytes
-                            window_speed = window_bytes / (now - last_adapt_time)
-                            total_elapsed = now - start_time
-                            avg_speed = received_bytes / total_elapsed if total_elapsed > 0 else 0
-                            if avg_speed > 0:
-                                delta = (window_speed - avg_speed) / avg_speed
-                                if delta > ADAPT_IMPROVE_THRESHOLD and current_chunk_size < MAX_BUFFER_SIZE:
-                                    current_chunk_size = min(current_chunk_size * 2, MAX_BUFFER_SIZE)
-                                elif delta < -ADAPT_WORSEN_THRESHOLD and current_chunk_size > MIN_BUFFER_SIZE:
-                                    current_chunk_size = max(current_chunk_size // 2, MIN_BUFFER_SIZE)
-                            last_adapt_time = now
-                            last_adapt_bytes = received_bytes
-                        
-                        if received_bytes - last_update_bytes > UPDATE_BYTES_THRESHOLD or received_bytes == file_size:
-                            elapsed_time = time.time() - start_time
-                            speed = received_bytes / elapsed_time if elapsed_time > 0 else 0
-                            self.progress.emit(float(received_bytes), float(file_size), speed)
-                            last_update_bytes = received_bytes
-                
-                # Émission finale pour s'assurer que la barre de progression atteint 100%
-                elapsed_time = time.time() - start_time
-                speed = received_bytes / elapsed_time if elapsed_time > 0 else 0
-                self.progress.emit(float(received_bytes), float(file_size), speed)
-                
-                self.file_received.emit(f"File '{os.path.basename(save_path)}' received in Downloads.")
+                # OPTIMISATION: ACK immédiats (Linux) pendant l'en-tête et le début
+                # du transfert; les delayed-ACK (~40ms) freinent la montée de la
+                # fenêtre de congestion de l'émetteur pendant le slow-start
+                self._set_quickack(conn)
+
+                version, file_size, stream_offset, stream_length, stream_count, name_len = \
+                    struct.unpack(HEADER_FORMAT, self._recv_exact(conn, HEADER_LENGTH))
+                if version != PROTOCOL_VERSION:
+                    raise ConnectionError(f"Unsupported protocol version: {version}")
+                filename = os.path.basename(self._recv_exact(conn, name_len).decode('utf-8'))
+
+                # Les flux d'un même envoi partagent le fichier de destination,
+                # retrouvé par (émetteur, nom, taille); le premier arrivé le crée
+                key = (addr[0], filename, file_size)
+                with self._transfers_lock:
+                    entry = self._transfers.get(key)
+                    # Ne jamais se raccrocher à l'entrée d'un envoi échoué ou
+                    # abandonné: un nouvel envoi du même fichier repart sur un
+                    # fichier frais au lieu d'écrire dans l'ancien
+                    if entry is not None and (entry["failed"] or (
+                            entry["active"] == 0 and
+                            time.monotonic() - entry["last_activity"] > SOCKET_TIMEOUT)):
+                        if entry["active"] > 0:
+                            # Des flux condamnés écrivent encore sur ce fd: ne pas
+                            # le fermer sous eux (le numéro serait réutilisé par le
+                            # nouveau fichier); refuser et laisser l'envoyeur réessayer
+                            raise ConnectionError("Previous failed transfer still draining; retry shortly.")
+                        self._drop_entry_locked(key, entry)
+                        entry = None
+                    if entry is None:
+                        save_path, fd = self.get_unique_save_path(downloads_path, filename)
+                        # OPTIMISATION: pré-allouer le fichier en une fois; les extents
+                        # sont contigus et le journal de métadonnées n'est touché qu'une fois
+                        try:
+                            os.posix_fallocate(fd, 0, file_size)
+                        except (AttributeError, OSError):
+                            # Repli portable (Windows/FS sans fallocate): fixer au moins
+                            # la taille finale pour éviter les agrandissements successifs
+                            try:
+                                os.ftruncate(fd, file_size)
+                            except OSError:
+                                pass
+                        entry = {"fd": fd, "save_path": save_path,
+                                 "file_size": file_size,
+                                 "streams_left": stream_count, "received": 0,
+                                 "active": 0, "failed": False,
+                                 "last_activity": time.monotonic()}
+                        self._transfers[key] = entry
+                        self.bytes_total = file_size
+                        self.bytes_done = 0
+                        self.start_ns = time.monotonic_ns()
+                        self.reception_started.emit(f"{filename} from {addr[0]}")
+                    entry["active"] += 1
+
+                closing = False
+                complete = False
+                stream_ok = False
+                try:
+                    got = self._recv_stream(conn, entry, stream_offset, stream_length)
+                    stream_ok = got == stream_length
+                finally:
+                    # Le dernier flux (succès ou échec) ferme le fichier
+                    with self._transfers_lock:
+                        entry["active"] -= 1
+                        entry["streams_left"] -= 1
+                        entry["last_activity"] = time.monotonic()
+                        if not stream_ok:
+                            # Une plage manque: le transfert ne peut plus aboutir
+                            entry["failed"] = True
+                        if entry["streams_left"] <= 0:
+                            self._drop_entry_locked(key, entry)
+                            closing = True
+                            complete = entry["received"] == file_size
+                        elif entry["active"] == 0:
+                            # Des flux annoncés ne sont peut-être jamais arrivés:
+                            # expirer l'entrée si rien ne la touche d'ici le timeout
+                            reaper = threading.Timer(SOCKET_TIMEOUT,
+                                                     self._expire_transfer, args=(key, entry))
+                            reaper.daemon = True
+                            reaper.start()
+                if complete:
+                    self.file_received.emit(f"File '{os.path.basename(entry['save_path'])}' received in Downloads.")
+                elif closing:
+                    # Fin de connexion prématurée sans exception (FIN du pair):
+                    # signaler quand même la fin du transfert au GUI
+                    self.file_received.emit(
+                        f"Incomplete file '{os.path.basename(entry['save_path'])}' from {addr[0]} "
+                        f"({entry['received']}/{file_size} bytes).")
         except socket.timeout:
             self.file_received.emit(f"Connection from {addr[0]} timed out.")
         except Exception as e:
             self.file_received.emit(f"Error receiving file from {addr[0]}: {e}")
+        finally:
+            with self._conns_lock:
+                self._conns.discard(conn)
+
+    def _recv_stream(self, conn, entry, stream_offset, stream_length):
+        """Receives one byte range of a transfer into the shared destination fd."""
+        out_fd = entry["fd"]
+        received = 0
+        # Tente splice(2) (Linux): les pages passent du socket au fichier
+        # via un pipe entièrement côté noyau, sans copie en espace utilisateur
+        use_fallback = True
+        if hasattr(os, "splice") and received < stream_length:
+            pipe_r, pipe_w = os.pipe()
+            # Agrandir le pipe à la taille de chunk (64KB par défaut) pour déplacer
+            # un chunk entier par appel, et SPLICE_F_MOVE pour suggérer au noyau de
+            # déplacer les pages plutôt que de les copier
+            splice_flags = getattr(os, "SPLICE_F_MOVE", 0)
+            if fcntl is not None and hasattr(fcntl, "F_SETPIPE_SZ"):
+                try:
+                    fcntl.fcntl(pipe_w, fcntl.F_SETPIPE_SZ, BUFFER_SIZE)
+                except OSError:
+                    pass  # plafond fcntl du système atteint: le pipe reste à 64KB
+            try:
+                while received < stream_length:
+                    to_move = min(BUFFER_SIZE, stream_length - received)
+                    try:
+                        n = os.splice(conn.fileno(), pipe_w, to_move, flags=splice_flags)
+                    except BlockingIOError:
+                        _wait_ready(conn)
+                        continue
+                    if not n:
+                        break
+                    drained = 0
+                    while drained < n:
+                        drained += os.splice(pipe_r, out_fd, n - drained,
+                                             offset_dst=stream_offset + received + drained,
+                                             flags=splice_flags)
+                    received += n
+                    self._account(entry, n)
+                    self._set_quickack(conn)
+                use_fallback = False
+            except OSError:
+                # splice indisponible sur ce couple socket/fichier -> recv classique
+                pass
+            finally:
+                os.close(pipe_r)
+                os.close(pipe_w)
+        if use_fallback:
+            # OPTIMISATION: pipeline réseau/disque — ce thread remplit des buffers
+            # du pool pendant qu'un thread écrivain vide la file vers le fichier;
+            # les deux latences se recouvrent au lieu de s'additionner
+            write_q = queue.Queue(maxsize=8)
+            write_errors = []
+
+            def _writer():
+                # os.pwrite n'existe pas sous Windows: repli sur un handle
+                # propre à ce flux avec seek/write (un seul thread écrivain,
+                # donc pas de curseur partagé entre flux)
+                fh = None
+                if not hasattr(os, "pwrite"):
+                    try:
+                        fh = open(entry["save_path"], "r+b")
+                    except OSError as e:
+                        write_errors.append(e)
+                try:
+                    while True:
+                        job = write_q.get()
+                        if job is None:
+                            break
+                        buf, length, pos = job
+                        try:
+                            if not write_errors:
+                                if fh is None:
+                                    os.pwrite(out_fd, memoryview(buf)[:length], pos)
+                                else:
+                                    fh.seek(pos)
+                                    fh.write(memoryview(buf)[:length])
+                        except Exception as e:
+                            # Toute erreur doit aboutir dans write_errors: un thread
+                            # écrivain mort laisserait le producteur bloqué à jamais
+                            # sur la file pleine
+                            write_errors.append(e)
+                        finally:
+                            _buffer_put(buf)
+                finally:
+                    if fh is not None:
+                        try:
+                            fh.close()
+                        except OSError:
+                            pass
+
+            writer = threading.Thread(target=_writer)
+            writer.daemon = True
+            writer.start()
+            try:
+                while received < stream_length and not write_errors:
+                    buffer = _buffer_get(BUFFER_SIZE)
+                    view = memoryview(buffer)
+                    to_recv = min(BUFFER_SIZE, stream_length - received)
+                    n = conn.recv_into(view[:to_recv])
+                    if not n:
+                        _buffer_put(buffer)
+                        break
+                    write_q.put((buffer, n, stream_offset + received))
+                    received += n
+                    self._account(entry, n)
+                    self._set_quickack(conn)
+            finally:
+                write_q.put(None)
+                writer.join()
+            if write_errors:
+                raise write_errors[0]
+        return received
+
+    def _set_quickack(self, conn):
+        """Re-arms TCP_QUICKACK; the kernel resets it after each recv."""
+        try:
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        except (AttributeError, OSError):
+            pass
+
+    def _account(self, entry, n):
+        """Adds n received bytes to the transfer's shared counter."""
+        with self._transfers_lock:
+            entry["received"] += n
+            entry["last_activity"] = time.monotonic()
+            self.bytes_done = entry["received"]
+
+    def _drop_entry_locked(self, key, entry):
+        """Closes and forgets a transfer entry; caller holds _transfers_lock."""
+        # Garde d'identité: ne jamais évincer (ni fermer le fd d'un) successeur
+        # qui occuperait déjà la même clé
+        if self._transfers.get(key) is not entry:
+            return
+        try:
+            os.close(entry["fd"])
+        except OSError:
+            pass
+        self._transfers.pop(key, None)
+
+    def _expire_transfer(self, key, entry):
+        """Reaps an entry whose remaining streams never showed up."""
+        with self._transfers_lock:
+            if self._transfers.get(key) is not entry:
+                return
+            if entry["active"] > 0 or \
+                    time.monotonic() - entry["last_activity"] < SOCKET_TIMEOUT:
+                return
+            self._drop_entry_locked(key, entry)
+        self.file_received.emit(
+            f"Incomplete file '{os.path.basename(entry['save_path'])}' "
+            f"({entry['received']}/{entry['file_size']} bytes): missing streams.")
+
+    def _recv_exact(self, conn, length):
+        """Reads exactly `length` bytes from the connection."""
+        # OPTIMISATION: MSG_WAITALL fait attendre le noyau jusqu'à `length` octets,
+        # un seul recv au lieu d'une boucle Python. Uniquement hors Windows:
+        # Winsock définit le flag mais le refuse (WSAEOPNOTSUPP) sur un socket
+        # en mode timeout; ailleurs il est au pire ignoré et la boucle complète
+        if sys.platform != "win32" and hasattr(socket, "MSG_WAITALL"):
+            data = conn.recv(length, socket.MSG_WAITALL)
+            if len(data) == length:
+                return data
+        else:
+            data = b''
+        while len(data) < length:
+            chunk = conn.recv(length - len(data))
+            if not chunk:
+                raise ConnectionError("Connection closed early.")
+            data += chunk
+        return data
 
     def get_unique_save_path(self, directory, filename):
-        save_path = os.path.join(directory, filename)
+        """Atomically creates a free destination file; returns (path, fd)."""
+        # OPTIMISATION: O_CREAT|O_EXCL crée et réserve le nom en un seul appel
+        # atomique — plus de fenêtre exists/open exploitable par un autre
+        # receveur, et un seul syscall par candidat au lieu d'un stat + open
+        name, ext = os.path.splitext(filename)
+        candidate = filename
         counter = 1
-        original_save_path = save_path
-        while os.path.exists(save_path):
-            name, ext = os.path.splitext(original_save_path)
-            save_path = f"{name}_{counter}{ext}"
-            counter += 1
-        return save_path
+        while True:
+            save_path = os.path.join(directory, candidate)
+            try:
+                fd = os.open(save_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+                return save_path, fd
+            except FileExistsError:
+                candidate = f"{name}_{counter}{ext}"
+                counter += 1
 
 
 class App(QWidget):
@@ -414,16 +808,58 @@ class App(QWidget):
         super().__init__()
         self.title = "Local File Sharer"
         self.file_path = None
+        self.file_basename = None
         self.transfer_state = "idle"  # idle | active | finished
         self.threads = []
+        # OPTIMISATION: IP locale mise en cache avec un TTL de 30s — résolue via
+        # le trio socket/connect/getsockname seulement quand le cache expire,
+        # pas à chaque annonce envoyée ou reçue
+        self._local_ip = ""
+        self._local_ip_ts = float("-inf")
+        # OPTIMISATION: annonce pré-encodée une fois, invalidée quand le nom
+        # local ou l'IP change; chaque balise n'est plus qu'un sendto
+        self._announce_payload = b""
+        self._get_local_ip()
+        # OPTIMISATION: centre de l'écran disponible mémorisé; recalculé
+        # seulement quand la fenêtre ou l'écran principal change d'écran
+        self._centered_pos = None
+        self._screen_signal_connected = False
+        try:
+            QApplication.instance().primaryScreenChanged.connect(self._invalidate_centered_pos)
+        except Exception:
+            pass
+        # Index des appareils découverts par IP: recherche O(1) au lieu de
+        # parcourir les items du QListWidget à chaque annonce
+        self._device_items = {}
         self.initUI()
 
+    def _get_local_ip(self):
+        """Returns the local IPv4 address (cached 30s), or '' if unknown."""
+        now = time.monotonic()
+        if now - self._local_ip_ts < 30:
+            return self._local_ip
+        previous = self._local_ip
+        try:
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            s.connect(("8.8.8.8", 80))
+            self._local_ip = s.getsockname()[0]
+            s.close()
+        except Exception:
+            self._local_ip = ""
+        self._local_ip_ts = now
+        if self._local_ip != previous:
+            self._announce_payload = b""
+        return self._local_ip
+
     def initUI(self):
         self.setWindowTitle(self.title)
         layout = QVBoxLayout()
 
         self.devices_list = QListWidget()
-        
+        # OPTIMISATION: items mono-ligne de hauteur identique — Qt peut sauter
+        # le calcul de taille par item à chaque addItem/setText
+        self.devices_list.setUniformItemSizes(True)
+
         # Layout for the title and version
         # Layout for the title and version
         title_layout = QHBoxLayout()
@@ -492,13 +928,30 @@ class App(QWidget):
         self.file_receiver_thread = FileReceiverThread()
         self.file_receiver_thread.reception_started.connect(self.on_reception_started)
         self.file_receiver_thread.file_received.connect(self.on_file_received)
-        self.file_receiver_thread.progress.connect(self.update_progress)
         self.threads.append(self.file_receiver_thread)
         self.file_receiver_thread.start()
 
-        self.broadcast_timer = threading.Timer(BROADCAST_INTERVAL, self.broadcast_discovery)
-        self.broadcast_timer.daemon = True
-        self.broadcast_timer.start()
+        # OPTIMISATION: la progression est échantillonnée à 10 Hz côté GUI au lieu
+        # d'un signal Qt inter-threads émis à chaque chunk transféré
+        self._active_transfer = None
+        self._last_progress_total = 0
+        self._scaled_progress_total = 0
+        self._last_status_key = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.timeout.connect(self._sample_progress)
+        self._progress_timer.start(100)
+
+        # OPTIMISATION: un seul socket UDP persistant pour les annonces et un
+        # QTimer récurrent, au lieu de recréer socket + threading.Timer à chaque tick
+        self._bcast_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._bcast_sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        self._broadcast_timer = QTimer(self)
+        self._broadcast_timer.timeout.connect(self.broadcast_discovery)
+        self._broadcast_timer.start(BROADCAST_INTERVAL * 1000)
+        # OPTIMISATION: une fois les pairs connus, la présence est entretenue en
+        # unicast; le broadcast (inondation de tout le LAN, mal acheminé en Wi-Fi)
+        # ne sert plus qu'à la découverte initiale, un tick sur 5
+        self._beacon_tick = 0
 
         self.devices_list.itemSelectionChanged.connect(self.update_send_button_state)
     
@@ -509,32 +962,25 @@ class App(QWidget):
 
     def broadcast_discovery(self):
         """Sends UDP discovery packets."""
-        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
-            s.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            try:
+        # OPTIMISATION: pas de balise pendant un transfert — les broadcasts ne
+        # disputent pas la carte réseau aux flux de données
+        if self.transfer_state == "active":
+            return
+        try:
+            local_ip = self._get_local_ip()
+            if not self._announce_payload:
                 # Utilise le nom local configuré, inclut aussi l'IP locale pour éviter les NAT/bind ambigus
                 name = getattr(self, 'device_name', None) or 'PC'
-                try:
-                    # Détermination IP locale
-                    tmp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                    tmp.connect(("8.8.8.8", 80))
-                    local_ip = tmp.getsockname()[0]
-                    tmp.close()
-                except Exception:
-                    local_ip = ""
                 payload_text = f"discovery_announce:{name}|{local_ip}" if local_ip else f"discovery_announce:{name}"
-                payload = payload_text.encode("utf-8", errors="ignore")
-                # Nouveau format avec nom et IP
-                s.sendto(payload, ("<broadcast>", DISCOVERY_PORT))
-            except Exception as e:
-                print(f"Broadcast error: {e}") # Peut arriver si pas de réseau
-
-        # Si on veut déclencher un nouveau timer, c'est géré plus bas
-        
-        # Continue le broadcast tant que l'application est en cours d'exécution
-            self.broadcast_timer = threading.Timer(BROADCAST_INTERVAL, self.broadcast_discovery)
-            self.broadcast_timer.daemon = True
-            self.broadcast_timer.start()
+                self._announce_payload = payload_text.encode("utf-8", errors="ignore")
+            self._beacon_tick += 1
+            if not self._device_items or self._beacon_tick % 5 == 1:
+                self._bcast_sock.sendto(self._announce_payload, ("<broadcast>", DISCOVERY_PORT))
+            else:
+                _sendmmsg(self._bcast_sock, self._announce_payload,
+                          [(peer_ip, DISCOVERY_PORT) for peer_ip in self._device_items])
+        except Exception as e:
+            print(f"Broadcast error: {e}") # Peut arriver si pas de réseau
 
     def _show_main_window(self):
         self.showNormal()
@@ -653,70 +1099,44 @@ class App(QWidget):
             new_name = (text or '').strip() or 'PC'
             if new_name != self.device_name:
                 self.device_name = new_name
+                self._announce_payload = b""
                 self._save_config_device_name(self.device_name)
                 self.status_label.setText(f"Nom local défini: {self.device_name}")
-                # Envoyer une annonce immédiate (nouveau format uniquement)
-                try:
-                    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
-                        s.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-                        # Inclure l'IP locale si possible
-                        try:
-                            tmp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                            tmp.connect(("8.8.8.8", 80))
-                            local_ip = tmp.getsockname()[0]
-                            tmp.close()
-                        except Exception:
-                            local_ip = ""
-                        payload_text = f"discovery_announce:{self.device_name}|{local_ip}" if local_ip else f"discovery_announce:{self.device_name}"
-                        payload = payload_text.encode("utf-8", errors="ignore")
-                        s.sendto(payload, ("<broadcast>", DISCOVERY_PORT))
-                except Exception:
-                    pass
+                # Envoyer une annonce immédiate via le socket persistant
+                self.broadcast_discovery()
 
     def add_device(self, ip, hostname):
-        """Adds a discovered device (ip, hostname) to the list if it's not the local device."""
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            local_ip = s.getsockname()[0]
-            s.close()
-            if ip != local_ip:
-                # Check duplicates by stored IP in item data
-                for i in range(self.devices_list.count()):
-                    item = self.devices_list.item(i)
-                    if item.data(Qt.ItemDataRole.UserRole) == ip:
-                        # Ne pas écraser un nom connu par "Unknown"
-                        if hostname and hostname.strip():
-                            display_name = f"{ip} - {hostname}"
-                            if item.text() != display_name:
-                                item.setText(display_name)
-                        break
-                else:
-                    display_name = f"{ip} - {hostname.strip() if (hostname and hostname.strip()) else 'Unknown'}"
-                    item = QListWidgetItem(display_name)
-                    item.setData(Qt.ItemDataRole.UserRole, ip)
-                    self.devices_list.addItem(item)
-        except Exception:
-            # Si pas de connexion internet, on ne peut pas déterminer l'IP locale, on ajoute tout
-            for i in range(self.devices_list.count()):
-                item = self.devices_list.item(i)
-                if item.data(Qt.ItemDataRole.UserRole) == ip:
-                    if hostname and hostname.strip():
-                        display_name = f"{ip} - {hostname}"
-                        if item.text() != display_name:
-                            item.setText(display_name)
-                    break
-            else:
-                display_name = f"{ip} - {hostname.strip() if (hostname and hostname.strip()) else 'Unknown'}"
-                item = QListWidgetItem(display_name)
-                item.setData(Qt.ItemDataRole.UserRole, ip)
-                self.devices_list.addItem(item)
+        """Adds a discovered device (ip, hostname) to the list."""
+        # Les auto-annonces sont déjà filtrées dans le thread de découverte
+        self._upsert_device(ip, hostname)
+
+    def _upsert_device(self, ip, hostname):
+        """Creates or renames the list entry for a peer."""
+        entry = self._device_items.get(ip)
+        if entry is not None:
+            # Ne pas écraser un nom connu par "Unknown"
+            if hostname and hostname.strip():
+                display_name = f"{ip} - {hostname}"
+                item, current_text = entry
+                # OPTIMISATION: comparaison avec le texte mémorisé côté Python;
+                # pas d'aller-retour Qt (text puis setText) en régime établi
+                if current_text != display_name:
+                    item.setText(display_name)
+                    self._device_items[ip] = (item, display_name)
+        else:
+            display_name = f"{ip} - {hostname.strip() if (hostname and hostname.strip()) else 'Unknown'}"
+            item = QListWidgetItem(display_name)
+            item.setData(Qt.ItemDataRole.UserRole, ip)
+            self._device_items[ip] = (item, display_name)
+            self.devices_list.addItem(item)
 
     def select_file(self):
         file_path, _ = QFileDialog.getOpenFileName(self, "Select File")
         if file_path:
             self.file_path = file_path
-            self.status_label.setText(f"Selected: {os.path.basename(file_path)}")
+            # Nom de base calculé une fois à la sélection, réutilisé partout
+            self.file_basename = os.path.basename(file_path)
+            self.status_label.setText(f"Selected: {self.file_basename}")
             self.update_send_button_state()
 
     def send_file(self):
@@ -727,37 +1147,75 @@ class App(QWidget):
 
         self.progress_bar.setValue(0)
         self.progress_bar.setVisible(True)
+        self._last_status_key = None
         self.send_button.setEnabled(False)
         self.select_button.setEnabled(False)
         self.transfer_state = "active"
 
         item = selected_items[0]
         host = item.data(Qt.ItemDataRole.UserRole) or item.text().split(" ", 1)[0]
-        file_sender_thread = FileSenderThread(self.file_path, host)
-        file_sender_thread.progress.connect(self.update_progress)
-        file_sender_thread.finished.connect(self.on_send_finished)
-        self.threads.append(file_sender_thread) # Garder une référence
-        file_sender_thread.start()
-        self.status_label.setText(f"Sending {os.path.basename(self.file_path)} to {host}...")
+        # OPTIMISATION: une IP littérale part directement en connexion, sans
+        # passer par une résolution de nom
+        try:
+            ipaddress.ip_address(host)
+        except ValueError:
+            self.status_label.setText(f"Status: Invalid device address '{host}'.")
+            self.transfer_state = "idle"
+            self.send_button.setEnabled(True)
+            self.select_button.setEnabled(True)
+            self.progress_bar.setVisible(False)
+            return
+        # OPTIMISATION: worker poolé (QThreadPool borné) au lieu d'un QThread
+        # neuf par envoi gardé pour toujours dans self.threads
+        worker = FileSenderWorker(self.file_path, host)
+        worker.signals.finished.connect(self.on_send_finished)
+        self._active_transfer = worker
+        QThreadPool.globalInstance().start(worker)
+        self.status_label.setText(f"Sending {self.file_basename} to {host}...")
+
+    def _sample_progress(self):
+        """Samples the active worker's byte counters and refreshes the UI."""
+        worker = self._active_transfer
+        if worker is None or self.transfer_state != "active":
+            return
+        total = worker.bytes_total
+        if total <= 0:
+            return
+        current = worker.bytes_done
+        # OPTIMISATION: horloge monotone + arithmétique entière — time.time() peut
+        # reculer (NTP) et fausser la vitesse; la division flottante attend le calcul final
+        elapsed_ns = time.monotonic_ns() - worker.start_ns
+        speed = current * 1_000_000_000 // elapsed_ns if elapsed_ns > 0 else 0
+        self.update_progress(current, total, speed)
 
     def update_progress(self, current, total, speed):
         """Updates the UI with progress, speed, and ETA."""
         if total > 0:
-            scaled_total = int(total // 1024)
-            scaled_current = int(current // 1024)
+            # Arithmétique entière sur les compteurs bruts; le maximum de la
+            # barre n'est recalculé/réappliqué que si le total change
+            scaled_current = current // 1024
+            if total != self._last_progress_total:
+                self._last_progress_total = total
+                self._scaled_progress_total = total // 1024
+                if self._scaled_progress_total > 0:
+                    self.progress_bar.setMaximum(self._scaled_progress_total)
 
-            if scaled_total > 0 and self.progress_bar.maximum() != scaled_total:
-                self.progress_bar.setMaximum(scaled_total)
-
-            # Réduire la fréquence de mise à jour pour de meilleures perfs
             self.progress_bar.setValue(scaled_current)
 
-            percent = (current / total) * 100
-            speed_mbps = speed / (1024 * 1024)
-
-            if speed > 0 and current < total:
-                remaining_bytes = total - current
-                remaining_seconds = int(remaining_bytes / speed)
+            # OPTIMISATION: quantification au dixième de % et au centième de MB/s;
+            # si le texte affiché serait identique au précédent, on saute le
+            # formatage f-string et le setText (donc le repaint du label)
+            pct10 = current * 1000 // total
+            mbps100 = speed * 100 // 1048576
+            remaining_seconds = (total - current) // speed if (speed > 0 and current < total) else -1
+            status_key = (pct10, mbps100, remaining_seconds)
+            if status_key == self._last_status_key:
+                return
+            self._last_status_key = status_key
+
+            percent = pct10 / 10
+            speed_mbps = mbps100 / 100
+            if remaining_seconds >= 0:
                 minutes, seconds = divmod(remaining_seconds, 60)
                 eta_str = f"{minutes}m {seconds:02}s"
                 self.status_label.setText(f"Transferring... {percent:.1f}% at {speed_mbps:.2f} MB/s (ETA: {eta_str})")
@@ -770,6 +1228,8 @@ class App(QWidget):
         self.status_label.setText(f"Receiving {filename}...")
         self.progress_bar.setValue(0)
         self.progress_bar.setVisible(True)
+        self._last_status_key = None
+        self._active_transfer = self.file_receiver_thread
         self.transfer_state = "active"
 
     def on_send_finished(self):
@@ -825,18 +1285,30 @@ class App(QWidget):
         except Exception as e:
             pass
 
+    def _invalidate_centered_pos(self, *_args):
+        self._centered_pos = None
+
     def _show_and_center(self):
         try:
             self.showNormal()
             self.activateWindow()
             self.raise_()
-            # Centrer au milieu de l'écran disponible
-            screen = self.screen() or QApplication.primaryScreen()
-            if screen is not None:
-                avail = screen.availableGeometry()
-                frame = self.frameGeometry()
-                frame.moveCenter(avail.center())
-                self.move(frame.topLeft())
+            # Seul le centre de l'écran est mis en cache; le coin haut-gauche est
+            # recalculé avec la géométrie courante de la fenêtre, qui peut avoir
+            # été redimensionnée depuis le dernier centrage
+            if self._centered_pos is None:
+                screen = self.screen() or QApplication.primaryScreen()
+                if screen is None:
+                    return
+                # Le QWindow natif n'existe qu'après le premier show
+                handle = self.windowHandle()
+                if handle is not None and not self._screen_signal_connected:
+                    handle.screenChanged.connect(self._invalidate_centered_pos)
+                    self._screen_signal_connected = True
+                self._centered_pos = screen.availableGeometry().center()
+            frame = self.frameGeometry()
+            frame.moveCenter(self._centered_pos)
+            self.move(frame.topLeft())
         except Exception:
             # En cas de souci, au moins rendre visible
             try:
@@ -847,7 +1319,11 @@ class App(QWidget):
     def closeEvent(self, event):
         # OPTIMISATION: Arrêt plus propre des threads
         try:
-            self.broadcast_timer.cancel()
+            self._broadcast_timer.stop()
+        except Exception:
+            pass
+        try:
+            self._bcast_sock.close()
         except Exception:
             pass
         
@@ -862,22 +1338,24 @@ class App(QWidget):
         except Exception:
             pass
 
-        for thread in self.threads:
-            if isinstance(thread, FileSenderThread):
-                try:
-                    thread.stop()
-                except Exception:
-                    pass
+        if isinstance(self._active_transfer, FileSenderWorker):
+            try:
+                self._active_transfer.stop()
+            except Exception:
+                pass
 
         for thread in self.threads:
             if isinstance(thread, QThread):
                 thread.requestInterruption()
-        
-        # Attendre qu'ils se terminent
+
+        # OPTIMISATION: fenêtre de drainage de 300ms partagée par tous les
+        # threads (ils s'arrêtent en parallèle), au lieu de 300ms chacun en série
+        deadline = time.monotonic() + 0.3
         for thread in self.threads:
-             if isinstance(thread, QThread):
-                thread.wait(300) # Attendre brièvement
-        
+            if isinstance(thread, QThread):
+                thread.wait(max(0, int((deadline - time.monotonic()) * 1000)))
+        QThreadPool.globalInstance().waitForDone(max(0, int((deadline - time.monotonic()) * 1000)))
+
         event.accept()
 
 